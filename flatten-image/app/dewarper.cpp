@@ -312,12 +312,13 @@ void Dewarper::build_fisheye_undistort_map() {
 
             // Apply fisheye distortion polynomial to get distorted angle
             // For fisheye model: theta_d = theta * (1 + k1*theta^2 + k2*theta^4 + k3*theta^6 + k4*theta^8)
-            float theta2 = theta * theta;
-            float theta4 = theta2 * theta2;
-            float theta6 = theta4 * theta2;
-            float theta8 = theta6 * theta2;
-            float theta_d = theta * (1.0f + config_.k1 * theta2 + config_.k2 * theta4 +
-                                     config_.k3 * theta6 + config_.k4 * theta8);
+            // Evaluated in Horner form: one multiply-add per coefficient. Note that theta is r_out
+            // here, unlike the atan(r) model of OpenCV and the Python check scripts
+            float theta2  = theta * theta;
+            float poly    = config_.k3 + theta2 * config_.k4;
+            poly          = config_.k2 + theta2 * poly;
+            poly          = config_.k1 + theta2 * poly;
+            float theta_d = theta * (1.0f + theta2 * poly);
 
             // Convert back to normalized distorted coordinates
             float scale_d = (r_out > 1e-8f) ? (theta_d / r_out) : 1.0f;
@@ -4,7 +4,7 @@ Extract default parameters from dewarp_gui.py without running the GUI
 """
 import sys
 
-# Read the parameters from dewarp_gui.py
+# Read the parameters from dewarp_gui.py (Cfg defaults)
 MODE = "CONTROLLED"
 SCALE = 0.4
 
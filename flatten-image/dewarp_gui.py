@@ -1,103 +1,144 @@
-import sys
+import argparse
+import logging
 import cv2
 import numpy as np
 import tkinter as tk
 from tkinter import ttk, filedialog
 from PIL import Image, ImageTk
 import time
+import queue
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+log = logging.getLogger(__name__)
+
+# Maps de l'aperçu construites par table radiale si numba est disponible
+try:
+    from reference_map import fisheye_inverse_map_lut, max_radius, radial_scale_lut
+except ImportError:
+    fisheye_inverse_map_lut = None
 
 # ============================
 # CONFIGURATION
 # ============================
 
-USE_REMAP = True  # switch OpenCV method here
+@dataclass(frozen=True)
+class Cfg:
+    mode: str = "CONTROLLED"
+    scale: float = 0.4
+    debounce_ms: int = 200
+
+    show_guides: bool = True
+    guide_color: tuple = (0, 255, 0)   # vert
+    guide_thickness: int = 4
+
+    # Réduction de l'aperçu interactif (le rendu pleine résolution est fait à l'enregistrement)
+    preview_factor: int = 4
+
+    # Aperçu en niveaux de gris : suffit pour aligner les guides, 3x moins
+    # d'octets à remapper (l'enregistrement reste en couleur)
+    preview_gray: bool = True
 
-DEBOUNCE_MS = 2000
-MODE = "CONTROLLED"
-SCALE = 0.4
 
 # je de paramètres à peu près ok pour "image2.jpg"
-# MODE = "CONTROLLED"
-# SCALE = 0.5
+# mode = "CONTROLLED"
+# scale = 0.5
 # f = 1212
 # k1 = -0.162
 # k2 = 0.05
 
 # je de paramètres à peu près ok pour "image2.jpg"
-# MODE = "CONTROLLED"
-# SCALE = 1.0
+# mode = "CONTROLLED"
+# scale = 1.0
 # f = 727
 # k1 = 0.081
 # k2 = 0.05
 
 # je de paramètres affinés pour "image2.jpg"
-# MODE = "CONTROLLED"
-# SCALE = 1.0
+# mode = "CONTROLLED"
+# scale = 1.0
 # f = 725
 # k1 = 0.09
 # k2 = 0.05
 
 
 # je de paramètres affinés pour "image2.jpg"
-# MODE = "CONTROLLED"
-# SCALE = 0.5
+# mode = "CONTROLLED"
+# scale = 0.5
 # f = 960
 # k1 = 0.0
 # k2 = 0.0
 
-SHOW_GUIDES = True
-GUIDE_COLOR = (0, 255, 0)   # vert
-GUIDE_THICKNESS = 4
+# Ordre des paramètres dans les snapshots (tuples)
+PARAM_NAMES = ("f", "cx", "cy", "k1", "k2", "k3", "k4")
+
+# Nombre de jeux de maps conservés (navigation avant/arrière sur un slider)
+MAP_CACHE_SIZE = 4
+
+# Période de relève des résultats du thread de calcul
+RESULT_POLL_MS = 20
 
 # ============================
 # UTILITIES
 # ============================
-def draw_guides(img):
+def draw_guides(img, color, thickness):
     """
     Dessine des lignes guides verticales pour l'aide à la calibration.
     """
-    h, w = img.shape[:2]
-
-    print("[GUIDES] Drawing guide lines")
+    w = img.shape[1]
 
     x_center = w // 2
     x_left = int(w * 0.25)
     x_right = int(w * 0.75)
 
-    # Ligne verticale centrale
-    cv2.line(img, (x_center, 0), (x_center, h),
-             GUIDE_COLOR, GUIDE_THICKNESS)
+    # Lignes verticales pleine hauteur : simple affectation de colonnes
+    t = thickness
+    for x in (x_center, x_left, x_right):
+        img[:, max(0, x - t // 2):x + t // 2 + 1] = color
 
-    # Lignes verticales latérales
-    cv2.line(img, (x_left, 0), (x_left, h),
-             GUIDE_COLOR, GUIDE_THICKNESS)
+    return img
 
-    cv2.line(img, (x_right, 0), (x_right, h),
-             GUIDE_COLOR, GUIDE_THICKNESS)
 
-    return img
+def cuda_available():
+    """
+    True si OpenCV a été compilé avec CUDA et qu'un GPU est présent.
+    """
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
 
 
-def resize_for_display(img, max_w, max_h):
+def resize_for_display(img, max_w, max_h, interpolation=cv2.INTER_AREA):
     h, w = img.shape[:2]
     scale = min(max_w / w, max_h / h)
-    new_size = (int(w * scale), int(h * scale))
-    return cv2.resize(img, new_size, interpolation=cv2.INTER_AREA)
+    new_size = (max(1, int(w * scale)), max(1, int(h * scale)))
+    return cv2.resize(img, new_size, interpolation=interpolation)
+
+
+def bgr_to_pil(img):
+    # Le décodeur raw de PIL inverse les canaux BGR -> RGB lui-même,
+    # sans passe cv2.cvtColor supplémentaire
+    h, w = img.shape[:2]
+    return Image.frombuffer("RGB", (w, h), img, "raw", "BGR", 0, 1)
 
 # ============================
 # MAIN APP
 # ============================
 
 class DewarpApp(tk.Tk):
-    def __init__(self, image_path):
+    def __init__(self, image_path, cfg=Cfg()):
         super().__init__()
 
-        print("[INIT] Starting Dewarp GUI")
+        self.cfg = cfg
+
+        log.debug("[INIT] Starting Dewarp GUI")
 
         self.title("Fisheye Dewarp Calibration Tool")
         self.geometry("1400x700")
 
-        print("[UI] Forcing window visibility")
+        log.debug("[UI] Forcing window visibility")
         self.update_idletasks()
         self.deiconify()
         self.lift()
@@ -110,7 +151,27 @@ class DewarpApp(tk.Tk):
             raise RuntimeError("Unable to load image")
 
         self.H, self.W = self.original.shape[:2]
-        print(f"[INFO] Image loaded: {self.W}x{self.H}")
+        log.info("[INFO] Image loaded: %dx%d", self.W, self.H)
+
+        # Source réduite pour l'aperçu pendant le réglage
+        self.original_small = cv2.resize(
+            self.original,
+            (self.W // cfg.preview_factor, self.H // cfg.preview_factor),
+            interpolation=cv2.INTER_AREA
+        )
+        self.original_small_gray = cv2.cvtColor(self.original_small, cv2.COLOR_BGR2GRAY)
+        self.preview_fast = cfg.preview_gray
+
+        # Les images source ne changent jamais : un seul upload vers le GPU
+        self.use_cuda = cuda_available()
+        if self.use_cuda:
+            log.info("[INFO] CUDA device found, remap runs on GPU")
+            self._src_gpu = cv2.cuda_GpuMat()
+            self._src_gpu.upload(self.original)
+            self._src_small_gpu = cv2.cuda_GpuMat()
+            self._src_small_gpu.upload(self.original_small)
+            self._src_small_gray_gpu = cv2.cuda_GpuMat()
+            self._src_small_gray_gpu.upload(self.original_small_gray)
 
         # Default params
         self.params = {
@@ -126,26 +187,58 @@ class DewarpApp(tk.Tk):
         self.last_params_snapshot = self.snapshot_params()
         self.debounce_job = None
 
+        # Cache LRU des maps de remap, indexé par paramètres + géométrie
+        self._map_cache = OrderedDict()
+        self.map1 = None
+        self.map2 = None
+
+        # Matrices de calibration réutilisées par le thread de calcul
+        self._R_eye = np.eye(3, dtype=np.float32)
+        self._K = np.eye(3, dtype=np.float32)
+        self._K_out = np.eye(3, dtype=np.float32)
+        self._D = np.zeros(4, dtype=np.float32)
+
+        # L'original ne change pas : son affichage (INTER_AREA) n'est
+        # refait que si la zone disponible change
+        self._left_display = None
+        self._left_bounds = None
+        # PhotoImage Tk persistantes, recréées uniquement si la taille change
+        self.left_imgtk = None
+        self.right_imgtk = None
+
+        # Le dewarp tourne dans un thread unique (OpenCV relâche le GIL) ;
+        # les résultats reviennent au thread Tk par une file, étiquetés
+        # d'un numéro de job pour écarter les rendus périmés
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._results = queue.Queue()
+        self._job_id = 0
+        self.dewarped = None
+        # Paramètres du dernier aperçu affiché
+        self._last_key = None
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
         self._build_ui()
         self.update_idletasks()
+        self.bind("<Configure>", self._on_configure)
+        self.after(RESULT_POLL_MS, self._poll_results)
         # Lancer le premier rendu APRÈS que la fenêtre soit affichée
-        self.after(0, lambda: self._update_images(initial=True))
+        self.after(0, self._update_images)
 
     # ------------------------
 
     def snapshot_params(self):
-        return {k: v.get() for k, v in self.params.items()}
+        return tuple(self.params[k].get() for k in PARAM_NAMES)
 
     def params_changed(self):
         current = self.snapshot_params()
         changed = current != self.last_params_snapshot
-        print(f"[DEBUG] Params changed: {changed}")
+        log.debug("[DEBUG] Params changed: %s", changed)
         return changed
 
     # ------------------------
 
     def _build_ui(self):
-        print("[UI] Adding test label")
+        log.debug("[UI] Building controls")
 
 
         # Image frames
@@ -242,112 +335,283 @@ class DewarpApp(tk.Tk):
     # ------------------------
 
     def _on_param_change(self):
+        # <FocusOut> se déclenche aussi en simple navigation (Tab) : ne pas
+        # réarmer le debounce si rien n'a changé
+        try:
+            if self.snapshot_params() == self.last_params_snapshot:
+                return
+        except tk.TclError:
+            # Saisie en cours non numérique
+            return
+
         if self.debounce_job:
             self.after_cancel(self.debounce_job)
 
-        self.debounce_job = self.after(DEBOUNCE_MS, self._debounced_update)
+        self.debounce_job = self.after(self.cfg.debounce_ms, self._debounced_update)
 
     # ------------------------
 
     def _debounced_update(self):
-        if not self.params_changed():
-            print("[INFO] No parameter change detected, skipping recompute")
+        self.debounce_job = None
+        try:
+            changed = self.params_changed()
+        except tk.TclError:
+            # Champ laissé non numérique ; <Return>/<FocusOut> relancera
+            log.debug("[INFO] Invalid parameter entry, skipping recompute")
+            return
+
+        if not changed:
+            log.debug("[INFO] No parameter change detected, skipping recompute")
             return
 
-        print("[INFO] Recomputing dewarp")
+        log.debug("[INFO] Recomputing dewarp")
         self.status.config(text="Recalcul en cours…")
-        self.update_idletasks()
 
         self._update_images()
 
         self.last_params_snapshot = self.snapshot_params()
-        self.status.config(text="Ready")
 
     # ------------------------
 
-    def _compute_dewarp(self):
-        # --- Lecture des paramètres UI ---
-        f = self.params["f"].get()
-        cx = self.params["cx"].get()
-        cy = self.params["cy"].get()
-        k1 = self.params["k1"].get()
-        k2 = self.params["k2"].get()
-        k3 = self.params["k3"].get()
-        k4 = self.params["k4"].get()
-
-        print(f"[PARAMS] f={f:.2f} cx={cx:.2f} cy={cy:.2f} "
-              f"k=({k1:.4f},{k2:.4f},{k3:.4f},{k4:.4f})")
+    def _compute_dewarp_preview(self, params):
+        return self._compute_dewarp(params, preview=True)
+
+    def _compute_dewarp(self, params, preview=False):
+        # Exécuté dans le thread de calcul : aucun accès Tk ici,
+        # les paramètres arrivent déjà lus depuis l'UI (ordre PARAM_NAMES)
+        f, cx, cy, k1, k2, k3, k4 = params
+
+        # Config liée en locales une fois pour toutes
+        cfg = self.cfg
+        mode = cfg.mode
+        scale = cfg.scale
+
+        log.debug("[PARAMS] f=%.2f cx=%.2f cy=%.2f k=(%.4f,%.4f,%.4f,%.4f) preview=%s",
+                  f, cx, cy, k1, k2, k3, k4, preview)
+
+        # --- Source et géométrie (aperçu réduit ou pleine résolution) ---
+        if preview:
+            if self.preview_fast:
+                src = self.original_small_gray
+                src_gpu = self._src_small_gray_gpu if self.use_cuda else None
+            else:
+                src = self.original_small
+                src_gpu = self._src_small_gpu if self.use_cuda else None
+            # Les intrinsèques sont en pixels : même facteur que l'image
+            f, cx, cy = (v / cfg.preview_factor for v in (f, cx, cy))
+        else:
+            src = self.original
+            src_gpu = self._src_gpu if self.use_cuda else None
+        size = (src.shape[1], src.shape[0])
 
-        # --- Matrice intrinsèque d’entrée ---
-        K = np.array([
-            [f, 0.0, cx],
-            [0.0, f, cy],
-            [0.0, 0.0, 1.0]
-        ], dtype=np.float32)
+        # --- Matrice intrinsèque d’entrée (mise à jour en place) ---
+        K = self._K
+        K[0, 0] = f
+        K[1, 1] = f
+        K[0, 2] = cx
+        K[1, 2] = cy
 
-        D = np.array([k1, k2, k3, k4], dtype=np.float32)
+        D = self._D
+        D[:] = (k1, k2, k3, k4)
 
         # --- Matrice de sortie (K_out) ---
-        if MODE == "LEGACY":
-            K_out = K
-            print("[INFO] MODE=LEGACY (exact legacy behavior)")
-        elif MODE == "CONTROLLED":
-            K_out = K.copy()
-            K_out[0, 0] *= SCALE
-            K_out[1, 1] *= SCALE
-            print(f"[INFO] MODE=CONTROLLED (SCALE={SCALE:.3f})")
+        K_out = self._K_out
+        K_out[:] = K
+        if mode == "LEGACY":
+            log.debug("[INFO] MODE=LEGACY (exact legacy behavior)")
+        elif mode == "CONTROLLED":
+            K_out[0, 0] *= scale
+            K_out[1, 1] *= scale
+            log.debug("[INFO] MODE=CONTROLLED (SCALE=%.3f)", scale)
         else:
             raise ValueError("Invalid MODE")
 
-        print("[DEBUG] K_out:")
-        print(K_out)
+        log.debug("[DEBUG] K_out:\n%s", K_out)
 
-        # --- Construction des maps ---
-        map1, map2 = cv2.fisheye.initUndistortRectifyMap(
-            K, D,
-            np.eye(3, dtype=np.float32),
-            K_out,
-            (self.W, self.H),
-            cv2.CV_16SC2
-        )
+        # --- Construction des maps (ou réutilisation depuis le cache) ---
+        # La table radiale n'est qu'approchée : réservée à l'aperçu, le
+        # rendu enregistré reste celui d'OpenCV
+        use_lut = preview and fisheye_inverse_map_lut is not None
+        key = self._map_key((f, cx, cy, k1, k2, k3, k4), size, mode, scale, use_lut)
+        self.map1, self.map2, gpu_maps = self._get_maps(key, K, D, K_out, use_lut)
 
         # --- Remap ---
-        dewarped = cv2.remap(
-            self.original,
-            map1,
-            map2,
-            interpolation=cv2.INTER_LINEAR,
-            borderMode=cv2.BORDER_CONSTANT
-        )
-
-        if SHOW_GUIDES:
-            dewarped = draw_guides(dewarped)
+        if self.use_cuda:
+            map1_gpu, map2_gpu = gpu_maps
+            dewarped = cv2.cuda.remap(
+                src_gpu,
+                map1_gpu,
+                map2_gpu,
+                cv2.INTER_LINEAR,
+                borderMode=cv2.BORDER_CONSTANT
+            ).download()
+        else:
+            dewarped = cv2.remap(
+                src,
+                self.map1,
+                self.map2,
+                interpolation=cv2.INTER_LINEAR,
+                borderMode=cv2.BORDER_CONSTANT
+            )
 
         return dewarped
 
     # ------------------------
 
-    def _update_images(self, initial=False):
-        print("[RENDER] Updating images")
+    def _map_key(self, params, size, mode, scale, use_lut):
+        # Arrondi pour absorber le bruit des sliders
+        params = tuple(round(v, 6) for v in params)
+        return params + size + (mode, scale, use_lut)
+
+    def _get_maps(self, key, K, D, K_out, use_lut):
+        maps = self._map_cache.get(key)
+        if maps is not None:
+            log.debug("[CACHE] Maps hit")
+            self._map_cache.move_to_end(key)
+            return maps
+
+        log.debug("[CACHE] Maps miss, building")
+        cpu_maps = self._build_maps(K, D, K_out, key[7:9], use_lut)
+
+        gpu_maps = self._upload_maps(cpu_maps) if self.use_cuda else None
+        maps = cpu_maps + (gpu_maps,)
 
-        if initial:
-            dewarped = self._compute_dewarp()
+        self._map_cache[key] = maps
+        if len(self._map_cache) > MAP_CACHE_SIZE:
+            self._map_cache.popitem(last=False)
+        return maps
+
+    def _build_maps(self, K, D, K_out, size, use_lut):
+        if use_lut:
+            map_x, map_y = self._build_lut_maps(K, D, K_out, size)
         else:
-            dewarped = self._compute_dewarp()
+            map_x, map_y = cv2.fisheye.initUndistortRectifyMap(
+                K, D,
+                self._R_eye,
+                K_out,
+                size,
+                cv2.CV_32FC1
+            )
+        # cv2.cuda.remap n'accepte que des maps flottantes
+        if self.use_cuda:
+            return map_x, map_y
+
+        # Format virgule fixe (int16 + index de fraction) consommé
+        # directement par le chemin SIMD de cv2.remap
+        return cv2.convertMaps(map_x, map_y, cv2.CV_16SC2)
+
+    def _build_lut_maps(self, K, D, K_out, size):
+        """
+        Approximation d'initUndistortRectifyMap (R = identité) : atan +
+        polynôme remplacés par une table theta_d / r tenant en L1. L'erreur
+        croît quand f diminue (~0.1 px à f=200), d'où l'usage aperçu seul.
+        """
+        W, H = size
+        f_in, cx_in, cy_in = float(K[0, 0]), float(K[0, 2]), float(K[1, 2])
+        f_out, cx_out, cy_out = float(K_out[0, 0]), float(K_out[0, 2]), float(K_out[1, 2])
+        r_max = max_radius(H, W, f_out, cx_out, cy_out)
+        lut = radial_scale_lut(*(float(k) for k in D), r_max)
+        return fisheye_inverse_map_lut(
+            H, W, f_in, cx_in, cy_in, f_out, cx_out, cy_out, lut, r_max
+        )
+
+    def _upload_maps(self, maps):
+        gpu_maps = []
+        for m in maps:
+            m_gpu = cv2.cuda_GpuMat()
+            m_gpu.upload(m)
+            gpu_maps.append(m_gpu)
+        return tuple(gpu_maps)
+
+    # ------------------------
+
+    def _update_images(self):
+        log.debug("[RENDER] Updating images")
+
+        params = self.snapshot_params()
+        # Un job peut encore tourner : il est invalidé dans les deux cas
+        self._job_id += 1
+        if params == self._last_key and self.dewarped is not None:
+            # Retour aux paramètres affichés avant la fin du job en cours
+            log.debug("[RENDER] Same params as last frame, reusing dewarp")
+            self._show_images()
+            self.status.config(text="Ready")
+            return
 
+        job_id = self._job_id
+        future = self._executor.submit(self._compute_dewarp_preview, params)
+        future.add_done_callback(lambda fut: self._results.put((job_id, params, fut)))
+
+    def _poll_results(self):
+        try:
+            while True:
+                job_id, params, future = self._results.get_nowait()
+                if job_id != self._job_id:
+                    log.debug("[RENDER] Discarding stale result %d", job_id)
+                    continue
+                try:
+                    self._apply_result(future.result())
+                    self._last_key = params
+                except Exception as e:
+                    log.error("[ERROR] Dewarp failed: %s", e)
+                    self.status.config(text="Erreur")
+        except queue.Empty:
+            pass
+
+        self.after(RESULT_POLL_MS, self._poll_results)
+
+    def _apply_result(self, dewarped):
         self.dewarped = dewarped
+        self._show_images()
+        self.status.config(text="Ready")
+
+    def _display_bounds(self):
+        return self.winfo_width() // 2 - 20, self.winfo_height() - 200
 
-        max_w = self.winfo_width() // 2 - 20
-        max_h = self.winfo_height() - 200
+    def _on_configure(self, event):
+        # Les widgets enfants propagent aussi <Configure> : seule la
+        # fenêtre principale change la zone d'affichage
+        if event.widget is not self or self.dewarped is None:
+            return
+        if self._display_bounds() != self._left_bounds:
+            self._show_images()
 
-        left = resize_for_display(self.original, max_w, max_h)
-        right = resize_for_display(dewarped, max_w, max_h)
+    def _show_images(self):
+        dewarped = self.dewarped
 
-        self.left_imgtk = ImageTk.PhotoImage(Image.fromarray(cv2.cvtColor(left, cv2.COLOR_BGR2RGB)))
-        self.right_imgtk = ImageTk.PhotoImage(Image.fromarray(cv2.cvtColor(right, cv2.COLOR_BGR2RGB)))
+        max_w, max_h = self._display_bounds()
+        if max_w <= 0 or max_h <= 0:
+            # Fenêtre trop petite pour afficher quoi que ce soit
+            return
 
-        self.left_label.config(image=self.left_imgtk)
-        self.right_label.config(image=self.right_imgtk)
+        if self._left_bounds != (max_w, max_h):
+            self._left_display = resize_for_display(
+                self.original, max_w, max_h, cv2.INTER_AREA
+            )
+            self.left_imgtk = self._paste_photo(self.left_label, self.left_imgtk, self._left_display)
+            self._left_bounds = (max_w, max_h)
+
+        # Aperçu refait à chaque réglage : un simple échantillonnage suffit
+        right = resize_for_display(dewarped, max_w, max_h, cv2.INTER_NEAREST)
+        if right.ndim == 2:
+            # Aperçu gris : repassé en 3 canaux à la taille d'affichage seulement
+            right = cv2.cvtColor(right, cv2.COLOR_GRAY2BGR)
+
+        # Guides tracés à la taille d'affichage : nets à l'écran et
+        # absents de l'image enregistrée
+        if self.cfg.show_guides:
+            right = draw_guides(right, self.cfg.guide_color, self.cfg.guide_thickness)
+
+        self.right_imgtk = self._paste_photo(self.right_label, self.right_imgtk, right)
+
+    def _paste_photo(self, label, photo, img):
+        h, w = img.shape[:2]
+        if photo is None or photo.width() != w or photo.height() != h:
+            photo = ImageTk.PhotoImage(Image.new("RGB", (w, h)))
+            label.config(image=photo)
+        # Copie directe dans l'image Tk existante
+        photo.paste(bgr_to_pil(img))
+        return photo
 
     # ------------------------
 
@@ -357,18 +621,35 @@ class DewarpApp(tk.Tk):
             filetypes=[("JPEG", "*.jpg")]
         )
         if path:
-            cv2.imwrite(path, self.dewarped)
-            print(f"[INFO] Dewarped image saved to {path}")
+            self.status.config(text="Rendu pleine résolution…")
+            self.update_idletasks()
+            # Même thread que les aperçus : le cache de maps n'est jamais
+            # partagé entre threads
+            future = self._executor.submit(self._compute_dewarp, self.snapshot_params())
+            cv2.imwrite(path, future.result())
+            self.status.config(text="Ready")
+            log.info("[INFO] Dewarped image saved to %s", path)
+
+    def _on_close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
 
 # ============================
 # ENTRY POINT
 # ============================
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python dewarp_gui.py <image_path>")
-        sys.exit(1)
-
-    app = DewarpApp(sys.argv[1])
-    print("[MAIN] Entering Tk mainloop")
+    parser = argparse.ArgumentParser(description="Fisheye dewarp calibration tool")
+    parser.add_argument("image_path", help="fisheye image to calibrate on")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="print debug traces for every update")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING,
+        format="%(message)s"
+    )
+
+    app = DewarpApp(args.image_path)
+    log.debug("[MAIN] Entering Tk mainloop")
     app.mainloop()
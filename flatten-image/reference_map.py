@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Numba kernels for the fisheye inverse map: an exact reference for
+full-image diffing against OpenCV when checking the C++ port, and the
+lookup-table approximation dewarp_gui.py uses for its preview maps
+Run: python3 reference_map.py (requires numba)
+"""
+import math
+
+import numpy as np
+from numba import njit, prange
+
+# Entries of the radial scale table. Interpolation error is < 0.001 px at
+# the default parameters but grows as f_out shrinks (~0.1 px at f=200 with
+# large k), so the table is only meant for previews
+LUT_SIZE = 1024
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def fisheye_inverse_map(H, W, f_in, cx_in, cy_in, f_out, cx_out, cy_out, k1, k2, k3, k4):
+    """
+    Input pixel coordinates (map_x, map_y) for every output pixel,
+    same layout as cv2.fisheye.initUndistortRectifyMap with CV_32FC1
+    """
+    map_x = np.empty((H, W), np.float32)
+    map_y = np.empty((H, W), np.float32)
+    for v in prange(H):
+        for u in range(W):
+            # Normalized output coordinates
+            x = (u - cx_out) / f_out
+            y = (v - cy_out) / f_out
+
+            # Distortion model, Horner form
+            r = math.sqrt(x * x + y * y)
+            theta = math.atan(r)
+            t2 = theta * theta
+            theta_d = theta * (1.0 + t2 * (k1 + t2 * (k2 + t2 * (k3 + t2 * k4))))
+
+            scale_d = theta_d / r if r > 1e-8 else 1.0
+            map_x[v, u] = f_in * x * scale_d + cx_in
+            map_y[v, u] = f_in * y * scale_d + cy_in
+    return map_x, map_y
+
+
+def radial_scale_lut(k1, k2, k3, k4, r_max, n=LUT_SIZE):
+    """
+    Table of scale_d = theta_d / r over [0, r_max], theta = atan(r)
+    """
+    r = np.linspace(0.0, r_max, n)
+    theta = np.arctan(r)
+    t2 = theta * theta
+    theta_d = theta * (1.0 + t2 * (k1 + t2 * (k2 + t2 * (k3 + t2 * k4))))
+    lut = np.ones(n, np.float32)
+    lut[1:] = theta_d[1:] / r[1:]  # scale_d -> 1 when r -> 0
+    return lut
+
+
+def max_radius(H, W, f_out, cx_out, cy_out):
+    """
+    Largest normalized radius reached by the output grid (one of its corners)
+    """
+    dx = max(abs(cx_out), abs(W - 1 - cx_out)) / f_out
+    dy = max(abs(cy_out), abs(H - 1 - cy_out)) / f_out
+    return math.hypot(dx, dy)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def fisheye_inverse_map_lut(H, W, f_in, cx_in, cy_in, f_out, cx_out, cy_out, lut, r_max):
+    """
+    Same map as fisheye_inverse_map, with atan + polynomial + divide
+    replaced by a linear interpolation in radial_scale_lut
+    """
+    map_x = np.empty((H, W), np.float32)
+    map_y = np.empty((H, W), np.float32)
+    last = lut.shape[0] - 1
+    step = last / r_max if r_max > 0.0 else 0.0
+    for v in prange(H):
+        for u in range(W):
+            x = (u - cx_out) / f_out
+            y = (v - cy_out) / f_out
+
+            idx = math.sqrt(x * x + y * y) * step
+            i0 = min(int(idx), last - 1)
+            frac = idx - i0
+            scale_d = lut[i0] + frac * (lut[i0 + 1] - lut[i0])
+
+            map_x[v, u] = f_in * x * scale_d + cx_in
+            map_y[v, u] = f_in * y * scale_d + cy_in
+    return map_x, map_y
+
+
+if __name__ == "__main__":
+    import test_opencv_fisheye as ref
+
+    W, H = ref.size
+    map_x, map_y = fisheye_inverse_map(
+        H, W,
+        ref.f_in, ref.cx, ref.cy,
+        ref.f_out, ref.cx, ref.cy,
+        ref.k1, ref.k2, ref.k3, ref.k4
+    )
+    print(f"Computed {W}x{H} map, comparing with cv2.fisheye.initUndistortRectifyMap")
+
+    r_max = max_radius(H, W, ref.f_out, ref.cx, ref.cy)
+    lut = radial_scale_lut(ref.k1, ref.k2, ref.k3, ref.k4, r_max)
+    lut_x, lut_y = fisheye_inverse_map_lut(
+        H, W,
+        ref.f_in, ref.cx, ref.cy,
+        ref.f_out, ref.cx, ref.cy,
+        lut, r_max
+    )
+
+    cv_maps = ref.opencv_maps()
+    ref.compare_with_opencv("Reference", map_x, map_y, cv_maps)
+    ref.compare_with_opencv("LUT", lut_x, lut_y, cv_maps)
+    print("Reference maps match OpenCV's cv2.fisheye.initUndistortRectifyMap")